@@ -1,60 +1,147 @@
 import argparse
+import functools
 import importlib
 import logging
-import os
-import pathlib
 import sys
-from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING
 
-from . import j1939, logreader, tester
 from .errors import Error
 
-# Remove once less users are using the old package structure.
-from . import database as db  # isort: skip
+if TYPE_CHECKING:
+    from . import database, j1939, logreader, tester
+
+    # Remove once less users are using the old package structure.
+    from . import database as db  # isort: skip
+
+    __version__: str
 
 __author__ = 'Erik Moqvist'
 
-try:
-    __version__ = version("cantools")
-except PackageNotFoundError:
-    # package is not installed
-    pass
+
+@functools.cache
+def _get_version():
+    """Return the version of the installed cantools package, or ``None``
+    if it is not installed.
+
+    Reading the package metadata is slow, so this is only done when the
+    version is needed, and only once."""
+
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("cantools")
+    except PackageNotFoundError:
+        # package is not installed
+        return None
+
+
+def _print_version():
+    print(_get_version() or 'unknown')
+
+
+# Subpackages are imported on first access, as importing all of them is
+# slow and most users (and CLI commands) only need some of them.
+_LAZY_SUBMODULES = {
+    'database': '.database',
+    'db': '.database',
+    'j1939': '.j1939',
+    'logreader': '.logreader',
+    'tester': '.tester',
+}
 
 
-class _ErrorSubparser:
-    def __init__(self, subparser_name, error_message):
-        self.subparser_name = subparser_name
-        self.error_message = error_message
+def __getattr__(name):
+    if name == '__version__':
+        package_version = _get_version()
 
-    def add_subparser(self, subparser_list):
-        err_parser = \
-            subparser_list.add_parser(self.subparser_name,
-                                      description = self.error_message)
-        err_parser.add_argument("args", nargs="*")
+        if package_version is None:
+            raise AttributeError(
+                f'module {__name__!r} has no attribute {name!r}')
 
-        err_parser.set_defaults(func=self._print_error)
+        globals()[name] = package_version
+
+        return package_version
+
+    try:
+        module_name = _LAZY_SUBMODULES[name]
+    except KeyError:
+        raise AttributeError(
+            f'module {__name__!r} has no attribute {name!r}') from None
+
+    module = importlib.import_module(module_name, __name__)
+    globals()[name] = module
+
+    return module
+
+
+def __dir__():
+    return list(globals()) + list(_LAZY_SUBMODULES)
+
+
+# The CLI commands, one per module in the 'subparsers' sub-package. This
+# is a static list, as listing the directory at runtime is slow and does
+# not work if cantools is run from a zipapp or a frozen executable.
+_SUBCOMMANDS = (
+    'convert',
+    'decode',
+    'dump',
+    'generate_c_source',
+    'list',
+    'monitor',
+    'plot',
+)
 
-    def _print_error(self, args):
-        raise ImportError(self.error_message)
 
 def _load_subparser(subparser_name, subparsers):
-    """Load a subparser for a CLI command in a safe manner.
+    """Load the subparser for the CLI command called `subparser_name`.
 
-    i.e., if the subparser cannot be loaded due to an import error or
-    similar, no exception is raised if another command was invoked on
-    the CLI."""
+    Raises an ImportError with a message suitable for the user if the
+    subparser cannot be loaded, e.g. due to a missing optional
+    dependency."""
 
     try:
-        result = importlib.import_module(f'.subparsers.{subparser_name}',
+        module = importlib.import_module(f'.subparsers.{subparser_name}',
                                          package='cantools')
-        result.add_subparser(subparsers)
-
     except ImportError as e:
-        result = _ErrorSubparser(subparser_name,
-                                 f'Command "{subparser_name}" is unavailable: "{e}"')
-        result.add_subparser(subparsers)
+        raise ImportError(
+            f'Command "{subparser_name}" is unavailable: "{e}"') from e
 
-def _main():
+    module.add_subparser(subparsers)
+
+class _VersionAction(argparse.Action):
+    """Like argparse's 'version' action, but looks up the version only
+    if the option is given."""
+
+    def __init__(self, option_strings, dest, **kwargs):
+        super().__init__(option_strings,
+                         argparse.SUPPRESS,
+                         default=argparse.SUPPRESS,
+                         nargs=0,
+                         **kwargs)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        _print_version()
+        parser.exit()
+
+def _sniff_subcommand(argv, known_names):
+    """Return the name of the subcommand given in `argv`, or ``None`` if
+    no known subcommand was given.
+
+    Only the global options that do not take a value may precede the
+    subcommand, so the first positional argument is the subcommand."""
+
+    for arg in argv:
+        if arg in ('-d', '--debug', '--version'):
+            continue
+
+        if arg in known_names:
+            return arg
+
+        return None
+
+    return None
+
+def _create_parser(subcommand):
     parser = argparse.ArgumentParser(
         prog='cantools',
         description='Various CAN utilities.',
@@ -63,8 +150,7 @@ def _main():
 
     parser.add_argument('-d', '--debug', action='store_true')
     parser.add_argument('--version',
-                        action='version',
-                        version=__version__,
+                        action=_VersionAction,
                         help='Print version information and exit.')
 
     # Workaround to make the subparser required in Python 3.
@@ -72,22 +158,40 @@ def _main():
                                        dest='subcommand')
     subparsers.required = True
 
+    # only import the subparser of the invoked command, as importing
+    # all of them is slow; the others only get a placeholder so that
+    # they are still listed by --help
+    for subparser_name in _SUBCOMMANDS:
+        if subparser_name == subcommand:
+            _load_subparser(subparser_name, subparsers)
+        else:
+            subparsers.add_parser(subparser_name, add_help=False)
 
-    # load all subparses which have a source file in the cantools
-    # module's 'subparsers' sub-directory
-    subparsers_dir = pathlib.Path(__file__).parent / 'subparsers'
-    for cur_file_name in os.listdir(subparsers_dir):
-        if cur_file_name.startswith('__'):
-            continue
+    return parser
 
-        if cur_file_name.endswith('.py'):
-            subparser_name = cur_file_name[:-3]
-            _load_subparser(subparser_name, subparsers)
-        elif (subparsers_dir / cur_file_name / "__init__.py").is_file():
-            subparser_name = cur_file_name
-            _load_subparser(subparser_name, subparsers)
+def _main():
+    # print the version without building the parser, as the latter
+    # is comparably slow
+    if sys.argv[1:] == ['--version']:
+        _print_version()
+        sys.exit(0)
+
+    subcommand = _sniff_subcommand(sys.argv[1:], _SUBCOMMANDS)
 
-    args = parser.parse_args()
+    try:
+        parser = _create_parser(subcommand)
+        args, unknown_args = parser.parse_known_args()
+
+        if args.subcommand != subcommand:
+            # the subcommand was not found by sniffing, e.g. due to
+            # combined or abbreviated options, so parse again with the
+            # subparser of the command picked by argparse
+            parser = _create_parser(args.subcommand)
+            args = parser.parse_args()
+        elif unknown_args:
+            parser.error(f'unrecognized arguments: {" ".join(unknown_args)}')
+    except ImportError as e:
+        sys.exit('error: ' + str(e))
 
     if args.debug:
         logging.basicConfig(level=logging.DEBUG)
@@ -3,6 +3,11 @@ class Attribute:
 
     """
 
+    __slots__ = (
+        '_definition',
+        '_value',
+    )
+
     def __init__(self,
                  value,
                  definition):
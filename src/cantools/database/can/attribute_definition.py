@@ -1,3 +1,6 @@
+from ..utils import intern_string
+
+
 class AttributeDefinition:
     """A definition of an attribute that can be associated with attributes
     in nodes/messages/signals.
@@ -12,7 +15,9 @@ class AttributeDefinition:
                  minimum=None,
                  maximum=None,
                  choices=None):
-        self._name = name
+        # the attributes of all nodes, messages and signals refer to a
+        # few definitions, so intern their name
+        self._name = intern_string(name)
         self._default_value = default_value
         self._kind = kind
         self._type_name = type_name
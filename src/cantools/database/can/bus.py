@@ -1,17 +1,29 @@
 # A CAN bus.
 
+from ..utils import intern_string, resolve_comment
+
+
 class Bus:
     """A CAN bus.
 
     """
 
+    __slots__ = (
+        '_autosar',
+        '_baudrate',
+        '_comment',
+        '_comments',
+        '_fd_baudrate',
+        '_name',
+    )
+
     def __init__(self,
                  name,
                  comment=None,
                  baudrate=None,
                  fd_baudrate=None,
                  autosar_specifics=None):
-        self._name = name
+        self._name = intern_string(name)
 
         # If the 'comment' argument is a string, we assume that is an
         # English comment. This is slightly hacky, because the
@@ -25,6 +37,10 @@ class Bus:
             # multi-lingual dictionary
             self._comments = comment
 
+        # resolve "The" comment once, as it is read far more often
+        # than it is changed
+        self._comment = resolve_comment(self._comments)
+
         self._baudrate = baudrate
         self._fd_baudrate = fd_baudrate
 
@@ -46,23 +62,24 @@ class Bus:
         multiple languages were specified.
 
         """
-        if self._comments is None:
-            return None
-        elif self._comments.get(None) is not None:
-            return self._comments.get(None)
-        elif self._comments.get("FOR-ALL") is not None:
-            return self._comments.get("FOR-ALL")
-
-        return self._comments.get('EN')
+        return self._comment
 
     @property
     def comments(self):
         """The dictionary with the descriptions of the bus in multiple
         languages. ``None`` if unavailable.
 
+        :attr:`comment` is resolved when the comments are set, so
+        assign the dictionary again after modifying it in place.
+
         """
         return self._comments
 
+    @comments.setter
+    def comments(self, value):
+        self._comments = value
+        self._comment = resolve_comment(value)
+
     @property
     def baudrate(self):
         """The bus baudrate, or ``None`` if unavailable.
@@ -7,6 +7,11 @@ def num(number_as_string: str) -> Union[int, float]:
     """
 
     try:
+        # numbers with a decimal point are never integers, so parse
+        # them as floats directly instead of raising an exception
+        if isinstance(number_as_string, str) and '.' in number_as_string:
+            return float(number_as_string)
+
         return int(number_as_string)
     except ValueError:
         return float(number_as_string)
@@ -14,6 +14,15 @@ class InternalDatabase:
 
     """
 
+    __slots__ = (
+        'autosar',
+        'buses',
+        'dbc',
+        'messages',
+        'nodes',
+        'version',
+    )
+
     def __init__(self,
                  messages: list[Message],
                  nodes: list[Node],
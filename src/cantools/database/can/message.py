@@ -31,6 +31,7 @@ from ..utils import (
     decode_data,
     encode_data,
     format_or,
+    resolve_comment,
     sort_signals_by_start_bit,
     start_bit,
     type_sort_signals,
@@ -374,14 +375,7 @@ class Message:
         multiple languages were specified.
 
         """
-        if self._comments is None:
-            return None
-        elif self._comments.get(None) is not None:
-            return self._comments.get(None)
-        elif self._comments.get('FOR-ALL') is not None:
-            return self._comments.get('FOR-ALL')
-
-        return self._comments.get('EN')
+        return resolve_comment(self._comments)
 
     @comment.setter
     def comment(self, value: Optional[str]) -> None:
@@ -3,6 +3,7 @@ import typing
 from typing import Optional
 
 from ...typechecking import Comments
+from ..utils import resolve_comment
 
 if typing.TYPE_CHECKING:
     from ...database.can.formats.arxml import AutosarNodeSpecifics
@@ -58,14 +59,7 @@ class Node:
         multiple languages were specified.
 
         """
-        if self._comments is None:
-            return None
-        elif self._comments.get(None) is not None:
-            return self._comments.get(None)
-        elif self._comments.get("FOR-ALL") is not None:
-            return self._comments.get("FOR-ALL")
-
-        return self._comments.get('EN')
+        return resolve_comment(self._comments)
 
     @comment.setter
     def comment(self, value: Optional[str]) -> None:
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Optional, Union
 from ...typechecking import ByteOrder, Choices, Comments, SignalValueType
 from ..conversion import BaseConversion, IdentityConversion
 from ..namedsignalvalue import NamedSignalValue
+from ..utils import intern_string, resolve_comment
 
 if TYPE_CHECKING:
     from ...database.can.formats.dbc import DbcSpecifics
@@ -44,6 +45,30 @@ class Signal:
 
     """
 
+    __slots__ = (
+        '_comment',
+        '_comments',
+        'byte_order',
+        'conversion',
+        'dbc',
+        'initial',
+        'invalid',
+        'is_multiplexer',
+        'is_signed',
+        'length',
+        'maximum',
+        'minimum',
+        'multiplexer_ids',
+        'multiplexer_signal',
+        'name',
+        'raw_initial',
+        'raw_invalid',
+        'receivers',
+        'spn',
+        'start',
+        'unit',
+    )
+
     def __init__(
         self,
         name: str,
@@ -67,8 +92,11 @@ class Signal:
     ) -> None:
         # avoid using properties to improve encoding/decoding performance
 
+        # names, units and receivers are repeated in many signals of a
+        # database, so intern them to save memory
+
         #: The signal name as a string.
-        self.name: str = name
+        self.name: str = intern_string(name)
 
         #: The conversion instance, which is used to convert
         #: between raw and scaled/physical values.
@@ -114,13 +142,15 @@ class Signal:
         )
 
         #: The unit of the signal as a string, or ``None`` if unavailable.
-        self.unit: Optional[str] = unit
+        self.unit: Optional[str] = intern_string(unit)
 
         #: An object containing dbc specific properties like e.g. attributes.
         self.dbc: Optional[DbcSpecifics] = dbc_specifics
 
         #: A list of all receiver nodes of this signal.
-        self.receivers: list[str] = receivers or []
+        self.receivers: list[str] = (
+            [intern_string(receiver) for receiver in receivers] if receivers else []
+        )
 
         #: ``True`` if this is the multiplexer signal in a message, ``False``
         #: otherwise.
@@ -138,10 +168,6 @@ class Signal:
         #: has this attribute, ``None`` otherwise.
         self.spn: Optional[int] = spn
 
-        #: The dictionary with the descriptions of the signal in multiple
-        #: languages. ``None`` if unavailable.
-        self.comments: Optional[Comments]
-
         # if the 'comment' argument is a string, we assume that is an
         # english comment. this is slightly hacky because the
         # function's behavior depends on the type of the passed
@@ -236,6 +262,25 @@ class Signal:
             is_float=is_float,
         )
 
+    @property
+    def comments(self) -> Optional[Comments]:
+        """The dictionary with the descriptions of the signal in multiple
+        languages. ``None`` if unavailable.
+
+        :attr:`comment` is resolved when the comments are set, so
+        assign the dictionary again after modifying it in place.
+
+        """
+        return self._comments
+
+    @comments.setter
+    def comments(self, value: Optional[Comments]) -> None:
+        self._comments = value
+
+        # resolve "The" comment once, as it is read far more often
+        # than it is changed
+        self._comment = resolve_comment(value)
+
     @property
     def comment(self) -> Optional[str]:
         """The signal comment, or ``None`` if unavailable.
@@ -244,14 +289,7 @@ class Signal:
         multiple languages were specified.
 
         """
-        if self.comments is None:
-            return None
-        elif self.comments.get(None) is not None:
-            return self.comments.get(None)
-        elif self.comments.get("FOR-ALL") is not None:
-            return self.comments.get("FOR-ALL")
-
-        return self.comments.get("EN")
+        return self._comment
 
     @comment.setter
     def comment(self, value: Optional[str]) -> None:
@@ -268,13 +306,19 @@ class Signal:
             raise KeyError(err_msg) from exc
 
     def __repr__(self) -> str:
-        if self.choices is None:
+        conversion = self.conversion
+
+        if conversion.choices is None:
             choices = None
         else:
-            list_of_choices = ", ".join(
-                [f"{value}: '{text}'" for value, text in self.choices.items()]
-            )
-            choices = f"{{{list_of_choices}}}"
+            # str.join() turns a generator into a list anyway, so pass
+            # it a list right away
+            choices = "{" + ", ".join(
+                [
+                    f"{value}: '{text}'"
+                    for value, text in conversion.choices.items()
+                ]
+            ) + "}"
 
         return (
             f"signal("
@@ -284,8 +328,8 @@ class Signal:
             f"'{self.byte_order}', "
             f"{self.is_signed}, "
             f"{self.raw_initial}, "
-            f"{self.conversion.scale}, "
-            f"{self.conversion.offset}, "
+            f"{conversion.scale}, "
+            f"{conversion.offset}, "
             f"{self.minimum}, "
             f"{self.maximum}, "
             f"'{self.unit}', "
@@ -293,5 +337,5 @@ class Signal:
             f"{self.multiplexer_ids}, "
             f"{choices}, "
             f"{self.spn}, "
-            f"{self.comments})"
+            f"{self._comments})"
         )
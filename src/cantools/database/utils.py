@@ -2,6 +2,7 @@
 
 import os.path
 import re
+import sys
 from collections import OrderedDict
 from collections.abc import Sequence
 from typing import (
@@ -10,12 +11,15 @@ from typing import (
     Final,
     Literal,
     Optional,
+    TypeVar,
     Union,
+    cast,
 )
 
 from ..typechecking import (
     ByteOrder,
     Choices,
+    Comments,
     Formats,
     SignalDictType,
     SignalMappingType,
@@ -58,6 +62,39 @@ def format_and(items: list[Union[int, str]]) -> str:
                                   string_items[-1])
 
 
+_T = TypeVar("_T")
+
+
+def intern_string(value: _T) -> _T:
+    """Return the interned version of given value if it is a string, or
+    the unchanged value otherwise.
+
+    """
+    # sys.intern() only accepts exact strings, not subclasses of str
+    if type(value) is str:
+        return cast("_T", sys.intern(cast("str", value)))
+
+    return value
+
+
+def resolve_comment(comments: Optional[Comments]) -> Optional[str]:
+    """Return "The" comment of given multilingual comments, or ``None`` if
+    unavailable.
+
+    The language neutral comment is preferred, followed by the
+    ``FOR-ALL`` and the English one.
+
+    """
+    if comments is None:
+        return None
+    elif comments.get(None) is not None:
+        return comments.get(None)
+    elif comments.get("FOR-ALL") is not None:
+        return comments.get("FOR-ALL")
+
+    return comments.get("EN")
+
+
 def start_bit(signal: Union["Data", "Signal"]) -> int:
     if signal.byte_order == 'big_endian':
         return 8 * (signal.start // 8) + (7 - (signal.start % 8))
@@ -177,18 +214,22 @@ def decode_data(data: bytes,
     # scale the signal values and decode choices
     decoded: dict[str, SignalValueType] = {}
     for signal in signals:
-        if (value := unpacked.get(signal.name)) is None:
+        name = signal.name
+
+        if (value := unpacked.get(name)) is None:
             # signal value was removed above...
             continue
 
+        conversion = signal.conversion
+
         if scaling:
-            decoded[signal.name] = signal.conversion.raw_to_scaled(value, decode_choices)
+            decoded[name] = conversion.raw_to_scaled(value, decode_choices)
         elif (decode_choices
-              and signal.conversion.choices
-              and (choice := signal.conversion.choices.get(value, None)) is not None):
-            decoded[signal.name] = choice
+              and conversion.choices
+              and (choice := conversion.choices.get(value, None)) is not None):
+            decoded[name] = choice
         else:
-            decoded[signal.name] = value
+            decoded[name] = value
 
     return decoded
 
@@ -1241,6 +1241,25 @@ BATTERY_VT(
             db.add_dbc_file(dbc_out_path)
             self.assertEqual(db.version, '1.0')
 
+    def test_convert_prune_no_strict(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dbc_out_path = os.path.join(tmpdir, 'test_command_line_convert.dbc')
+            argv = [
+                'cantools',
+                'convert',
+                '--prune',
+                '--no-strict',
+                'tests/files/dbc/choices_issue_with_name.dbc',
+                dbc_out_path
+            ]
+
+            with patch('sys.argv', argv):
+                cantools._main()
+
+            db = cantools.database.load_file(dbc_out_path)
+            signal = db.messages[0].signals[0]
+            self.assertEqual(signal.choices, {1: 'CmdRespOK', 0: 'CmdRespErr'})
+
     def test_convert_bad_outfile(self):
         argv = [
             'cantools',
@@ -1575,6 +1594,119 @@ BATTERY_VT(
                 self.assertFalse((tmpdir / fuzzer_c).exists())
                 self.assertFalse((tmpdir / fuzzer_mk).exists())
 
+    def test_version(self):
+        argv = ['cantools', '--version']
+        stdout = StringIO()
+
+        with patch('sys.stdout', stdout), patch('sys.argv', argv):
+            with self.assertRaises(SystemExit) as cm:
+                cantools._main()
+
+        self.assertEqual(cm.exception.code, 0)
+        self.assertEqual(stdout.getvalue(), cantools.__version__ + '\n')
+
+    def test_version_not_installed(self):
+        from importlib.metadata import PackageNotFoundError
+
+        cantools._get_version.cache_clear()
+
+        try:
+            with patch('importlib.metadata.version',
+                       side_effect=PackageNotFoundError) as version:
+                self.assertIsNone(cantools._get_version())
+                self.assertIsNone(cantools._get_version())
+
+            # the package metadata is only searched once
+            self.assertEqual(version.call_count, 1)
+        finally:
+            cantools._get_version.cache_clear()
+
+    def test_debug_logging(self):
+        for debug, expected_calls in [([], 0), (['--debug'], 1)]:
+            argv = ['cantools', *debug, 'list', 'tests/files/dbc/foobar.dbc']
+            stdout = StringIO()
+
+            with patch('sys.stdout', stdout), \
+                 patch('sys.argv', argv), \
+                 patch('logging.basicConfig') as basic_config:
+                cantools._main()
+
+            self.assertEqual(basic_config.call_count, expected_calls)
+
+    def test_unavailable_subcommand(self):
+        argv = ['cantools', 'monitor', 'tests/files/dbc/motohawk.dbc']
+
+        with patch('sys.argv', argv), \
+             patch.dict(sys.modules, {'cantools.subparsers.monitor': None}):
+            with self.assertRaises(SystemExit) as cm:
+                cantools._main()
+
+        self.assertIn('error: Command "monitor" is unavailable: ',
+                      str(cm.exception))
+
+    def test_sniff_subcommand(self):
+        subcommands = cantools._SUBCOMMANDS
+        datas = [
+            ([], None),
+            (['dump', 'foo.dbc'], 'dump'),
+            (['-d', 'list', 'foo.dbc'], 'list'),
+            (['--debug', '--version', 'decode'], 'decode'),
+            (['foo', 'dump'], None),
+            (['-dd', 'dump'], None),
+            (['--deb', 'dump'], None),
+            (['-h'], None)
+        ]
+
+        for argv, expected in datas:
+            self.assertEqual(cantools._sniff_subcommand(argv, subcommands),
+                             expected)
+
+    def test_subcommand_not_sniffed(self):
+        # combined and abbreviated options are not understood by the
+        # sniffer, but argparse shall still find the subcommand
+        argv = ['cantools', '-dd', 'dump', '--help']
+        stdout = StringIO()
+
+        with patch('sys.stdout', stdout), patch('sys.argv', argv):
+            with self.assertRaises(SystemExit) as cm:
+                cantools._main()
+
+        self.assertEqual(cm.exception.code, 0)
+        self.assertTrue(stdout.getvalue().startswith('usage: cantools dump '))
+
+        argv = [
+            'cantools',
+            '--deb',
+            'decode',
+            '--single-line',
+            'tests/files/dbc/socialledge.dbc'
+        ]
+        input_data = '  vcan0  0C8   [8]  F0 00 00 00 00 00 00 00\n'
+        stdout = StringIO()
+
+        with patch('sys.stdin', StringIO(input_data)), \
+             patch('sys.stdout', stdout), \
+             patch('sys.argv', argv), \
+             patch('logging.basicConfig'):
+            cantools._main()
+
+        self.assertIn('SENSOR_SONARS(', stdout.getvalue())
+
+    def test_subcommands(self):
+        subparsers_dir = Path(cantools.__file__).parent / 'subparsers'
+        subcommands = []
+
+        for path in subparsers_dir.iterdir():
+            if path.name.startswith('__'):
+                continue
+
+            if path.suffix == '.py':
+                subcommands.append(path.stem)
+            elif (path / '__init__.py').is_file():
+                subcommands.append(path.name)
+
+        self.assertEqual(sorted(subcommands), list(cantools._SUBCOMMANDS))
+
 
 if __name__ == '__main__':
     unittest.main()
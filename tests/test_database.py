@@ -2614,9 +2614,37 @@ class CanToolsDatabaseTest(unittest.TestCase):
         bus = cantools.db.bus.Bus('foo', 'bar')
         self.assertEqual(repr(bus), "bus('foo', 'bar')")
 
+        bus = cantools.db.bus.Bus('foo', {'FOR-ALL': 'bar', 'EN': 'fie'})
+        self.assertEqual(bus.comment, 'bar')
+
+        bus = cantools.db.bus.Bus('foo', {'DE': 'fum', 'EN': 'fie'})
+        self.assertEqual(bus.comment, 'fie')
+
+        bus.comments['EN'] = 'foe'
+        bus.comments = bus.comments
+        self.assertEqual(bus.comment, 'foe')
+
+        bus = cantools.db.bus.Bus('foo', baudrate=500000, fd_baudrate=2000000)
+        self.assertEqual(bus.baudrate, 500000)
+        self.assertEqual(bus.fd_baudrate, 2000000)
+
     def test_num(self):
         self.assertEqual(cantools.database.can.formats.utils.num('1'), 1)
         self.assertEqual(cantools.database.can.formats.utils.num('1.0'), 1.0)
+        self.assertIsInstance(cantools.database.can.formats.utils.num('1'), int)
+        self.assertIsInstance(cantools.database.can.formats.utils.num('1.0'),
+                              float)
+        self.assertEqual(cantools.database.can.formats.utils.num('-1e3'), -1000.0)
+
+        with self.assertRaises(ValueError):
+            cantools.database.can.formats.utils.num('1.x')
+
+        # numbers are accepted as well
+        self.assertEqual(cantools.database.can.formats.utils.num(5), 5)
+        self.assertEqual(cantools.database.can.formats.utils.num(1.0), 1)
+
+        with self.assertRaises(ValueError):
+            cantools.database.can.formats.utils.num([])
 
         with self.assertRaises(ValueError):
             cantools.database.can.formats.utils.num('x')
@@ -3524,6 +3552,43 @@ class CanToolsDatabaseTest(unittest.TestCase):
         db.messages[0].signals[0].comment = 'TheNewComment'
         db.messages[0].signals[0].spn = 500
 
+    def test_signal_and_bus_names(self):
+        class Name(str):
+            pass
+
+        signal = cantools.database.can.Signal(Name('S'), 0, 8, unit=Name('m'))
+        self.assertEqual(signal.name, 'S')
+        self.assertEqual(signal.unit, 'm')
+
+        bus = cantools.db.bus.Bus(None)
+        self.assertIsNone(bus.name)
+
+    def test_signal_comments(self):
+        signal = cantools.database.can.Signal('S', 0, 8, comment='Foo')
+        self.assertEqual(signal.comment, 'Foo')
+        self.assertEqual(signal.comments, {None: 'Foo'})
+
+        signal.comments = {'FOR-ALL': 'Bar', 'EN': 'Fie'}
+        self.assertEqual(signal.comment, 'Bar')
+
+        comments = {'DE': 'Fum', 'EN': 'Fie'}
+        signal.comments = comments
+        self.assertEqual(signal.comment, 'Fie')
+
+        self.assertIs(signal.comments, comments)
+
+        # modified comments are picked up once assigned again
+        signal.comments['EN'] = 'Foe'
+        signal.comments = signal.comments
+        self.assertEqual(signal.comment, 'Foe')
+
+        signal.comment = 'Foo'
+        self.assertEqual(signal.comments, {None: 'Foo'})
+
+        signal.comment = None
+        self.assertIsNone(signal.comment)
+        self.assertIsNone(signal.comments)
+
     def test_refresh(self):
         with open('tests/files/dbc/attributes.dbc') as fin:
             db = cantools.db.load(fin)